@@ -294,6 +294,7 @@ class Player():
         self.multiplier = armor_multiplier * damage_multiplier
         self.white_low = (43.0 + bonus_damage) * self.multiplier
         self.white_high = (66.0 + bonus_damage) * self.multiplier
+        self.white_range = self.white_high - self.white_low
         self.shred_low = 1.2 * (
             self.white_low * 2.25 + (666 + self.shred_bonus) * self.multiplier
         )
@@ -343,6 +344,7 @@ class Player():
         bear_multi = self.multiplier * 1.04 # Master Shapeshifter
         self.white_bear_low = (109.0 + bear_bonus_damage) * bear_multi
         self.white_bear_high = (165.0 + bear_bonus_damage) * bear_multi
+        self.white_bear_range = self.white_bear_high - self.white_bear_low
         maul_multi = sf_fac * 1.2
         self.maul_low = (self.white_bear_low + 578 * bear_multi) * maul_multi
         self.maul_high = (self.white_bear_high + 578 * bear_multi) * maul_multi
@@ -360,21 +362,29 @@ class Player():
         self.faerie_fire_hit = (0.15 * bear_ap + 1.) * (1 + 0.13 * curse_of_elements) \
                                     * self.spell_damage_multiplier
 
-        # Adjust damage values for Gift of Arthas
+        # Adjust damage values for Gift of Arthas. The bonus is added to each
+        # bound directly rather than through string-keyed getattr / setattr
+        # calls, since this method runs on every stat change during a fight.
         if not gift_of_arthas:
             return
 
-        for bound in ['low', 'high']:
-            for ability in [
-                'white', 'shred', 'mangle', 'white_bear', 'maul', 'mangle_bear'
-            ]:
-                attr = '%s_%s' % (ability, bound)
-                setattr(self, attr, getattr(self, attr) + 8 * armor_multiplier)
-
-            bite_damage = getattr(self, 'bite_%s' % bound)
-
-            for cp in range(1, 6):
-                bite_damage[cp] += 8 * armor_multiplier
+        goa_bonus = 8 * armor_multiplier
+        self.white_low += goa_bonus
+        self.white_high += goa_bonus
+        self.shred_low += goa_bonus
+        self.shred_high += goa_bonus
+        self.mangle_low += goa_bonus
+        self.mangle_high += goa_bonus
+        self.white_bear_low += goa_bonus
+        self.white_bear_high += goa_bonus
+        self.maul_low += goa_bonus
+        self.maul_high += goa_bonus
+        self.mangle_bear_low += goa_bonus
+        self.mangle_bear_high += goa_bonus
+
+        for cp in range(1, 6):
+            self.bite_low[cp] += goa_bonus
+            self.bite_high[cp] += goa_bonus
 
     def calc_maul_dmg_gain(self, mangle_debuff):
         """Calculate how much damage a Maul adds over a bear auto-attack on
@@ -453,6 +463,7 @@ class Player():
         self.savage_roar = False
         self.dagger_equipped = False
         self.set_ability_costs()
+        self.sort_proc_trinkets()
 
         # Create dictionary to hold breakdown of total casts and damage
         self.dmg_breakdown = collections.OrderedDict()
@@ -465,6 +476,30 @@ class Player():
         ]:
             self.dmg_breakdown[cast_type] = {'casts': 0, 'damage': 0.0}
 
+    def sort_proc_trinkets(self):
+        """Split the equipped proc trinkets into lists according to which
+        attacks can trigger them. Done once per fight, since proc_trinkets can
+        be appended to after the Player is created, so that each attack only
+        loops over the trinkets that it can actually proc."""
+        proc_trinkets = self.proc_trinkets
+        self.hit_proc_trinkets = [
+            trinket for trinket in proc_trinkets
+            if not trinket.special_proc_conditions
+        ]
+        self.shred_proc_trinkets = [
+            trinket for trinket in proc_trinkets if trinket.shred_only
+        ]
+        self.mangle_proc_trinkets = [
+            trinket for trinket in proc_trinkets
+            if trinket.mangle_only or trinket.cat_mangle_only
+        ]
+        self.swipe_proc_trinkets = [
+            trinket for trinket in proc_trinkets if trinket.swipe_only
+        ]
+        self.periodic_proc_trinkets = [
+            trinket for trinket in proc_trinkets if trinket.periodic_only
+        ]
+
     def set_ability_costs(self):
         """Store Energy costs for all specials in the rotation based on whether
         or not Berserk is active."""
@@ -528,9 +563,8 @@ class Player():
         # can trigger on all possible abilities will be checked here. The
         # handful of proc effects that trigger only on Mangle must be
         # separately checked within the mangle() function.
-        for trinket in self.proc_trinkets:
-            if not trinket.special_proc_conditions:
-                trinket.check_for_proc(crit, yellow)
+        for trinket in self.hit_proc_trinkets:
+            trinket.check_for_proc(crit, yellow)
 
     def regen(self, delta_t):
         """Update player Energy and Mana.
@@ -571,10 +605,15 @@ class Player():
         Returns:
             damage_done (float): Damage done by the swing.
         """
-        low = self.white_low if self.cat_form else self.white_bear_low
-        high = self.white_high if self.cat_form else self.white_bear_high
-        damage_done, miss, crit = sim_utils.calc_white_damage(
-            low, high, self.miss_chance,
+        if self.cat_form:
+            low = self.white_low
+            damage_range = self.white_range
+        else:
+            low = self.white_bear_low
+            damage_range = self.white_bear_range
+
+        damage_done, miss, crit = sim_utils.calc_white_damage_fast(
+            low, damage_range, self.miss_chance,
             self.crit_chance - 0.04 * (not self.cat_form),
             crit_multiplier=self.calc_crit_multiplier()
         )
@@ -605,7 +644,9 @@ class Player():
             if dodge:
                 # Determine how much damage a successful non-crit / non-glance
                 # auto would have done.
-                proxy_damage = 0.5 * (low + high) * (1 + 0.15 * self.enrage)
+                proxy_damage = (
+                    (low + 0.5 * damage_range) * (1 + 0.15 * self.enrage)
+                )
             else:
                 proxy_damage = damage_done
 
@@ -627,6 +668,43 @@ class Player():
 
         return damage_done + roar_damage
 
+    def sample_swing_damage(self, num_swings):
+        """Draw the damage of many melee swings at once, assuming the current
+        player stats and buffs stay fixed for all of them. Intended as an
+        opt-in fast estimate of white damage for stat weight studies, so
+        unlike swing() no procs are checked, no Rage is generated and nothing
+        is logged.
+
+        Arguments:
+            num_swings (int): Number of swings to sample.
+
+        Returns:
+            damage_done (np.ndarray): Damage done by each swing, including
+                the Savage Roar bonus where applicable.
+        """
+        if self.cat_form:
+            low = self.white_low
+            damage_range = self.white_range
+        else:
+            low = self.white_bear_low
+            damage_range = self.white_bear_range
+
+        damage_done, _, _ = sim_utils.calc_white_damage_batch(
+            num_swings, low, low + damage_range, self.miss_chance,
+            self.crit_chance - 0.04 * (not self.cat_form),
+            crit_multiplier=self.calc_crit_multiplier()
+        )
+
+        # Apply King of the Jungle for bear form swings
+        if self.enrage:
+            damage_done *= 1.15
+
+        # Apply Savage Roar for cat form swings
+        if self.cat_form and self.savage_roar:
+            damage_done *= 1 + self.roar_fac
+
+        return damage_done
+
     def execute_bear_special(
         self, ability_name, min_dmg, max_dmg, rage_cost, yellow=True,
         mangle_mod=False
@@ -812,9 +890,8 @@ class Player():
         # Since a handful of proc effects trigger only on Shred, we separately
         # check for those procs here if the Shred landed successfully.
         if success:
-            for trinket in self.proc_trinkets:
-                if trinket.shred_only:
-                    trinket.check_for_proc(False, True)
+            for trinket in self.shred_proc_trinkets:
+                trinket.check_for_proc(False, True)
 
         return damage_done, success
 
@@ -874,7 +951,7 @@ class Player():
         # Since a handful of proc effects trigger only on Mangle, we separately
         # check for those procs here if the Mangle landed successfully.
         if success:
-            for trinket in self.proc_trinkets:
+            for trinket in self.mangle_proc_trinkets:
                 if trinket.mangle_only:
                     trinket.check_for_proc(False, True)
                 if trinket.cat_mangle_only and self.cat_form:
@@ -1149,9 +1226,8 @@ class Player():
 
                 # Since a handful of proc effects trigger only on Swipe, we
                 # separately check for those procs here.
-                for trinket in self.proc_trinkets:
-                    if trinket.swipe_only:
-                        trinket.check_for_proc(False, True)
+                for trinket in self.swipe_proc_trinkets:
+                    trinket.check_for_proc(False, True)
 
         num_hits = num_targets - num_misses - num_crits
 
@@ -3,16 +3,157 @@
 import numpy as np
 import copy
 import collections
+import itertools
+import os
+import random
 import urllib
 import multiprocessing
 import psutil
 
 
+# Maximum number of resampled values held in memory at once by the
+# bootstrap EP error calculation.
+BOOTSTRAP_BLOCK_ELEMENTS = 2**21
+
+# Reciprocals of the haste rating conversion factors for melee and spell
+# haste, so that the haste helpers multiply rather than divide.
+_INV_MELEE_HASTE_RATING = 1.0 / 2521
+_INV_SPELL_HASTE_RATING = 1.0 / 3279
+
+
+class DamageRollRNG():
+
+    """Random number source for the per-swing damage rolls. Plain uniforms
+    come one at a time straight from the standard library's random module,
+    which skips the NumPy call overhead entirely. Only the glancing blow
+    reductions are pre-generated in NumPy batches, and the vectorized damage
+    helpers draw from the underlying NumPy generator directly."""
+
+    def __init__(self, size=4096):
+        """Initialize generator with an empty glance buffer.
+
+        Arguments:
+            size (int): Number of glancing blow reductions generated per
+                NumPy batch. Scalar uniforms and the vectorized damage
+                helpers do not use it. Defaults to 4096.
+        """
+        self.size = size
+        self.seed()
+
+    def seed(self, seed=None):
+        """Create fresh underlying generators and discard any numbers left
+        over in the buffers.
+
+        Arguments:
+            seed (int or np.random.SeedSequence): Optional seed for the
+                generators. Defaults to None, which draws fresh entropy from
+                the operating system.
+        """
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+
+        # Give the scalar and batched generators independent child streams
+        scalar_seed, batch_seed = seed.spawn(2)
+        self.rng = np.random.default_rng(batch_seed)
+
+        # Bind the stdlib generator's draw method directly, so that each
+        # scalar draw is a single C-level call returning a plain Python
+        # float.
+        scalar_state = scalar_seed.generate_state(4, np.uint64).tobytes()
+        self.next = random.Random(
+            int.from_bytes(scalar_state, 'little')
+        ).random
+
+        # Parallel stream of glancing blow damage reductions, uniform in
+        # [0.15, 0.35). The affine transform is applied to whole batches in
+        # place, so the glance path pays for neither the scaling nor a
+        # separate uniform draw. The two-argument iter() calls
+        # _gen_glance_batch for a fresh batch whenever the previous one is
+        # used up. It never stops, because a batch is a list and can never
+        # equal the None sentinel.
+        glance_batches = iter(self._gen_glance_batch, None)
+        self.next_glance = itertools.chain.from_iterable(
+            glance_batches
+        ).__next__
+
+    def _gen_glance_batch(self):
+        """Generate a batch of glancing blow damage reductions."""
+        batch = self.rng.random(self.size)
+        batch *= 0.2
+        batch += 0.15
+        return batch.tolist()
+
+
+# Shared generator for the per-swing damage rolls below
+_rng = DamageRollRNG()
+
+
+def seed_rng(seed=None):
+    """Re-seed the shared damage roll generator. Must be called in each
+    worker process when replicates are run in parallel, since forked workers
+    otherwise inherit identical generator states.
+
+    Arguments:
+        seed (int or np.random.SeedSequence): Optional seed for the
+            generator. Passing one child of SeedSequence.spawn() per replicate
+            gives each replicate an independent, reproducible PCG64 stream.
+            Defaults to None, which draws fresh entropy from the operating
+            system.
+    """
+    _rng.seed(seed)
+
+
+def rand():
+    """Draw a single uniform random number in [0, 1) from the shared damage
+    roll generator. Much cheaper than np.random.rand() for scalar draws, and
+    reproducible through seed_rng().
+
+    Returns:
+        roll (float): Uniform random number.
+    """
+    return _rng.next()
+
+
+def run_trials_parallel(single_trial_fn, n_trials, n_workers=None, seed=None):
+    """Run independent Monte Carlo trials in parallel across a pool of worker
+    processes.
+
+    Arguments:
+        single_trial_fn (callable): Picklable function that performs one
+            trial. It is called with a single np.random.SeedSequence argument,
+            which it should use to seed its random number streams (for
+            example by passing it to seed_rng). Trials are dispatched one at
+            a time, so every trial runs on a freshly unpickled copy of the
+            function and any state it carries.
+        n_trials (int): Number of trials to run.
+        n_workers (int): Number of worker processes. Defaults to None, which
+            uses one worker per physical CPU core.
+        seed (int): Optional root seed from which an independent stream is
+            spawned for each trial. Defaults to None, which draws fresh
+            entropy from the operating system.
+
+    Returns:
+        results (list): Output of single_trial_fn for each trial, in order.
+    """
+    if n_workers is None:
+        # psutil returns None when the physical core count is unavailable
+        n_workers = psutil.cpu_count(logical=False) or os.cpu_count() or 1
+
+    seeds = np.random.SeedSequence(seed).spawn(n_trials)
+
+    # Re-seed the shared damage roll generator on worker startup, since
+    # forked workers otherwise inherit identical generator states.
+    with multiprocessing.Pool(n_workers, initializer=seed_rng) as pool:
+        return pool.map(single_trial_fn, seeds, chunksize=1)
+
+
 def calc_white_damage(
     low_end, high_end, miss_chance, crit_chance,
     crit_multiplier=2.0
 ):
-    """Execute single roll table for a melee white attack.
+    """Execute single roll table for a melee white attack. Convenience
+    wrapper around calc_white_damage_fast for callers that specify the high
+    end base damage rather than the width of the damage range.
 
     Arguments:
         low_end (float): Low end base damage of the swing.
@@ -27,17 +168,46 @@ def calc_white_damage(
         miss (bool): True if the attack was avoided.
         crit (bool): True if the attack was a critical strike.
     """
-    outcome_roll = np.random.rand()
+    return calc_white_damage_fast(
+        low_end, high_end - low_end, miss_chance, crit_chance,
+        crit_multiplier=crit_multiplier
+    )
+
+
+def calc_white_damage_fast(
+    low_end, damage_range, miss_chance, crit_chance,
+    crit_multiplier=2.0
+):
+    """Variant of calc_white_damage for callers that keep the swing damage
+    parameters fixed over many swings, and can therefore precompute the width
+    of the damage range once rather than on every swing.
+
+    Arguments:
+        low_end (float): Low end base damage of the swing.
+        damage_range (float): Difference between the high end and low end
+            base damage of the swing.
+        miss_chance (float): Probability that the swing is avoided.
+        crit_chance (float): Probability of a critical strike.
+        crit_multiplier (float): Damage multiplier on crits.
+            Defaults to 2.0.
+
+    Returns:
+        damage_done (float): Damage done by the swing.
+        miss (bool): True if the attack was avoided.
+        crit (bool): True if the attack was a critical strike.
+    """
+    outcome_roll = _rng.next()
 
     if outcome_roll < miss_chance:
         return 0.0, True, False
 
-    base_dmg = low_end + np.random.rand() * (high_end - low_end)
+    base_dmg = low_end + _rng.next() * damage_range
+    glance_threshold = miss_chance + 0.24
 
-    if outcome_roll < miss_chance + 0.24:
-        glance_reduction = 0.15 + np.random.rand() * 0.2
+    if outcome_roll < glance_threshold:
+        glance_reduction = _rng.next_glance()
         return (1.0 - glance_reduction) * base_dmg, False, False
-    if outcome_roll < miss_chance + 0.24 + crit_chance:
+    if outcome_roll < glance_threshold + crit_chance:
         return crit_multiplier * base_dmg, False, True
     return base_dmg, False, False
 
@@ -61,13 +231,13 @@ def calc_yellow_damage(
         miss (bool): True if the attack was avoided.
         crit (bool): True if the attack was a critical strike.
     """
-    miss_roll = np.random.rand()
+    miss_roll = _rng.next()
 
     if miss_roll < miss_chance:
         return 0.0, True, False
 
-    base_dmg = low_end + np.random.rand() * (high_end - low_end)
-    crit_roll = np.random.rand()
+    base_dmg = low_end + _rng.next() * (high_end - low_end)
+    crit_roll = _rng.next()
 
     if crit_roll < crit_chance:
         return crit_multiplier * base_dmg, False, True
@@ -91,87 +261,197 @@ def calc_spell_damage(
         miss (bool): True if the attack was avoided.
         crit (bool): True if the attack was a critical strike.
     """
-    base_dmg, miss, crit = calc_yellow_damage(low_end, high_end, 
-        miss_chance, crit_chance, crit_multiplier)
+    # The 2-roll table is inlined here rather than delegated to
+    # calc_yellow_damage, which saves a function call per spell cast.
+    miss_roll = _rng.next()
+
+    if miss_roll < miss_chance:
+        return 0.0, True, False
+
+    base_dmg = low_end + _rng.next() * (high_end - low_end)
+    crit = (_rng.next() < crit_chance)
+
+    if crit:
+        base_dmg *= crit_multiplier
+
     # Adjust for resistances, hard coded for pure level based resist
-    if not miss:
-        resist_roll = np.random.rand()
-        if resist_roll < 0.55:
-            base_dmg *= 1.0
-        elif resist_roll < 0.85:
-            base_dmg *= 0.9
-        else:
-            base_dmg *= 0.8
-    return base_dmg, miss, crit
-
-
-def piecewise_eval(t_fine, times, values):
+    resist_roll = _rng.next()
+
+    if resist_roll >= 0.85:
+        base_dmg *= 0.8
+    elif resist_roll >= 0.55:
+        base_dmg *= 0.9
+
+    return base_dmg, False, crit
+
+
+def calc_white_damage_batch(
+    num_swings, low_end, high_end, miss_chance, crit_chance,
+    crit_multiplier=2.0
+):
+    """Execute single roll table for a batch of independent melee white
+    attacks that share the same damage parameters. Vectorized counterpart of
+    calc_white_damage for Monte Carlo estimates over many swings at once.
+
+    Arguments:
+        num_swings (int): Number of swings to roll.
+        low_end (float): Low end base damage of the swing.
+        high_end (float): High end base damage of the swing.
+        miss_chance (float): Probability that the swing is avoided.
+        crit_chance (float): Probability of a critical strike.
+        crit_multiplier (float): Damage multiplier on crits.
+            Defaults to 2.0.
+
+    Returns:
+        damage_done (np.ndarray): Damage done by each swing.
+        miss (np.ndarray): Boolean mask, True where the attack was avoided.
+        crit (np.ndarray): Boolean mask, True where the attack was a critical
+            strike.
+    """
+    outcome_roll, damage_roll, glance_roll = _rng.rng.random((3, num_swings))
+    glance_thresh = miss_chance + 0.24
+    miss = outcome_roll < miss_chance
+    glance = (~miss) & (outcome_roll < glance_thresh)
+    crit = (
+        (outcome_roll >= glance_thresh)
+        & (outcome_roll < glance_thresh + crit_chance)
+    )
+    base_dmg = low_end + damage_roll * (high_end - low_end)
+    glance_multiplier = 1.0 - (0.15 + glance_roll * 0.2)
+    damage_done = np.where(
+        miss, 0.0, base_dmg * np.where(
+            glance, glance_multiplier, np.where(crit, crit_multiplier, 1.0)
+        )
+    )
+    return damage_done, miss, crit
+
+
+def calc_yellow_damage_batch(
+    num_attacks, low_end, high_end, miss_chance, crit_chance,
+    crit_multiplier=2.0
+):
+    """Execute 2-roll table for a batch of independent melee spells that
+    share the same damage parameters. Vectorized counterpart of
+    calc_yellow_damage for Monte Carlo estimates over many casts at once.
+
+    Arguments:
+        num_attacks (int): Number of casts to roll.
+        low_end (float): Low end base damage of the ability.
+        high_end (float): High end base damage of the ability.
+        miss_chance (float): Probability that the ability is avoided.
+        crit_chance (float): Probability of a critical strike.
+        crit_multiplier (float): Damage multiplier on crits.
+            Defaults to 2.0.
+
+    Returns:
+        damage_done (np.ndarray): Damage done by each cast.
+        miss (np.ndarray): Boolean mask, True where the attack was avoided.
+        crit (np.ndarray): Boolean mask, True where the attack was a critical
+            strike.
+    """
+    miss_roll, damage_roll, crit_roll = _rng.rng.random((3, num_attacks))
+    miss = miss_roll < miss_chance
+    crit = (~miss) & (crit_roll < crit_chance)
+
+    # Scale the damage rolls in place rather than allocating new arrays
+    damage_done = damage_roll
+    damage_done *= high_end - low_end
+    damage_done += low_end
+    damage_done[crit] *= crit_multiplier
+    damage_done[miss] = 0.0
+    return damage_done, miss, crit
+
+
+def piecewise_eval(t_fine, times, values, out=None):
     """Evaluate a piecewise constant function on a finer time mesh.
 
     Arguments:
-        t_fine (np.ndarray): Desired mesh for evaluation.
+        t_fine (np.ndarray): Desired mesh for evaluation, in ascending order.
         times (np.ndarray): Breakpoints of piecewise function.
         values (np.ndarray): Function values at the breakpoints.
+        out (np.ndarray): Optional pre-allocated array with the same shape as
+            t_fine to write the result into, so that repeated evaluations on
+            the same mesh can reuse one buffer. Defaults to None, which
+            allocates a new array.
 
     Returns:
         y_fine (np.ndarray): Function evaluated on the desired mesh.
     """
-    result = np.zeros_like(t_fine)
-
-    for i in range(len(times) - 1):
-        result += values[i] * ((t_fine >= times[i]) & (t_fine < times[i + 1]))
-
-    result += values[-1] * (t_fine >= times[-1])
+    if out is None:
+        out = np.empty_like(t_fine)
 
-    return result
+    # Since both the mesh and the breakpoints are sorted, each interval maps
+    # onto a contiguous slice of the mesh. Locate the slice edges with one
+    # binary search and fill every slice in a single pass. Mesh points that
+    # precede the first breakpoint are not covered by any interval and
+    # evaluate to zero.
+    edges = np.searchsorted(t_fine, times)
+    out[:edges[0]] = 0
+    out[edges[0]:] = np.repeat(values, np.diff(edges, append=len(t_fine)))
+    return out
 
 
 def calc_swing_timer(haste_rating, multiplier=1.0, cat_form=True):
-    """Calculate swing timer given a total haste rating stat.
+    """Calculate swing timer given a total haste rating stat. Also accepts
+    an array of haste ratings, in which case all swing timers are evaluated in
+    a single vectorized operation.
 
     Arguments:
-        haste_rating (int): Player haste rating stat.
+        haste_rating (int or np.ndarray): Player haste rating stat.
         multiplier (float): Overall haste multiplier from multiplicative haste
             buffs such as Bloodlust. Defaults to 1.
         cat_form (bool): If True, calculate Cat Form swing timer. If False,
             calculate Dire Bear Form swing timer. Defaults True.
 
     Returns:
-        swing_timer (float): Hasted swing timer in seconds.
+        swing_timer (float or np.ndarray): Hasted swing timer in seconds.
     """
     base_timer = 1.0 if cat_form else 2.5
-    return base_timer / (multiplier * (1 + haste_rating / 2521))
+    return base_timer / (
+        multiplier * (1 + haste_rating * _INV_MELEE_HASTE_RATING)
+    )
 
 
 def calc_haste_rating(swing_timer, multiplier=1.0, cat_form=True):
     """Calculate the haste rating that is consistent with a given swing timer.
+    Also accepts an array of swing timers.
 
     Arguments:
-        swing_timer (float): Hasted swing timer in seconds.
+        swing_timer (float or np.ndarray): Hasted swing timer in seconds.
         multiplier (float): Overall haste multiplier from multiplicative haste
             buffs such as Bloodlust. Defaults to 1.
         cat_form (bool): If True, assume swing timer is for Cat Form. If False,
             assume swing timer is for Dire Bear Form. Defaults True.
 
     Returns:
-        haste_rating (float): Unrounded haste rating.
+        haste_rating (float or np.ndarray): Unrounded haste rating.
     """
     base_timer = 1.0 if cat_form else 2.5
     return 2521 * (base_timer / (swing_timer * multiplier) - 1)
 
 
 def calc_hasted_gcd(haste_rating, multiplier=1.0):
-    """Calculate GCD for spell casts given a total haste rating stat.
+    """Calculate GCD for spell casts given a total haste rating stat. Also
+    accepts an array of haste ratings.
 
     Arguments:
-        haste_rating (int): Player haste rating stat.
+        haste_rating (int or np.ndarray): Player haste rating stat.
         multiplier (float): Overall spell haste multiplier from multiplicative
             haste buffs such as Bloodlust. Defaults to 1.
 
     Returns:
-        spell_gcd (float): Hasted GCD in seconds.
+        spell_gcd (float or np.ndarray): Hasted GCD in seconds.
     """
-    return max(1.5 / (multiplier * (1 + haste_rating / 3279)), 1.0)
+    spell_gcd = 1.5 / (
+        multiplier * (1 + haste_rating * _INV_SPELL_HASTE_RATING)
+    )
+
+    # Keep scalar inputs on the builtin max() so that the simulation loop
+    # continues to work with plain Python floats.
+    if isinstance(spell_gcd, np.ndarray):
+        return np.maximum(spell_gcd, 1.0)
+
+    return max(spell_gcd, 1.0)
 
 
 def gen_import_link(
@@ -199,54 +479,58 @@ def gen_import_link(
     Returns:
         import_link (str): Full URL for stat weight import into 80upgrades.
     """
-    link = 'https://eightyupgrades.com/ep/import?name='
+    # Collect URL fragments and join them once at the end, rather than
+    # re-copying the growing link on every concatenation.
+    parts = ['https://eightyupgrades.com/ep/import?name=']
 
     # EP Name
-    link += urllib.parse.quote(EP_name)
+    parts.append(urllib.parse.quote(EP_name))
 
     # Attack Power and Strength
     ap_weight = stat_weights['Attack Power']
     fap_weight = 1.2 * ap_weight
     str_weight = 2 * multiplier * ap_weight
-    link += '&31=%.2f&33=%.2f&4=%.2f' % (ap_weight, fap_weight, str_weight)
+    parts.append(f'&31={ap_weight:.2f}&33={fap_weight:.2f}&4={str_weight:.2f}')
 
     # Agility
     # Due to bear weaving, agi is no longer directly derived from
     # AP and crit.
     agi_weight = stat_weights['Agility']
-    link += '&0=%.2f' % agi_weight
+    parts.append(f'&0={agi_weight:.2f}')
 
     # Hit Rating and Expertise Rating
     hit_weight = stat_weights['Hit Rating']
-    link += '&35=%.2f' % (hit_weight)
+    parts.append(f'&35={hit_weight:.2f}')
 
     # Expertise Rating
     expertise_weight = stat_weights['Expertise Rating']
-    link += '&46=%.2f' % (expertise_weight)
+    parts.append(f'&46={expertise_weight:.2f}')
 
     # Critical Strike Rating
     crit_weight = stat_weights['Critical Strike Rating']
-    link += '&41=%.2f' % (crit_weight)
+    parts.append(f'&41={crit_weight:.2f}')
 
     # Haste Rating
     haste_weight = stat_weights['Haste Rating']
-    link += '&43=%.2f' % (haste_weight)
+    parts.append(f'&43={haste_weight:.2f}')
 
     # Armor Penetration
     arp_weight = stat_weights['Armor Pen Rating']
-    link += '&87=%.2f' % arp_weight
+    parts.append(f'&87={arp_weight:.2f}')
 
     # Weapon Damage
-    link += '&51=%.2f' % stat_weights['Weapon Damage']
+    parts.append(f'&51={stat_weights["Weapon Damage"]:.2f}')
 
     # Gems
     gem_size = 20 if epic_gems else 16
     gem_weight = gem_size * max(
         str_weight, agi_weight, crit_weight, haste_weight, arp_weight
     )
-    link += '&74=%.1f&75=%.1f&76=%.1f' % (gem_weight, gem_weight, gem_weight)
+    parts.append(
+        f'&74={gem_weight:.1f}&75={gem_weight:.1f}&76={gem_weight:.1f}'
+    )
 
-    return link
+    return ''.join(parts)
 
 
 def calc_ep_variance(
@@ -277,18 +561,29 @@ def calc_ep_variance(
             / final_iteration_count
         )
 
+    base_dps_vals = np.asarray(base_dps_vals)
+    incremented_dps_vals = np.asarray(incremented_dps_vals)
     num_bootstrap_iterations = max(final_iteration_count, 100000)
     bootstrap_ep_vals = np.zeros(num_bootstrap_iterations)
 
-    for i in range(num_bootstrap_iterations):
-        reference_sample = np.random.choice(
-            base_dps_vals, size=final_iteration_count, replace=True
+    # Rather than resampling one bootstrap iteration at a time, draw the
+    # resampling indices for a whole block of iterations at once and reduce
+    # each row of the block in a single vectorized pass. The block size is
+    # chosen to keep the temporary index arrays at a modest memory footprint.
+    block_size = max(1, BOOTSTRAP_BLOCK_ELEMENTS // final_iteration_count)
+
+    for start in range(0, num_bootstrap_iterations, block_size):
+        stop = min(start + block_size, num_bootstrap_iterations)
+        sample_shape = (stop - start, final_iteration_count)
+        reference_idx = np.random.randint(
+            len(base_dps_vals), size=sample_shape
         )
-        augmented_sample = np.random.choice(
-            incremented_dps_vals, size=final_iteration_count, replace=True
+        augmented_idx = np.random.randint(
+            len(incremented_dps_vals), size=sample_shape
         )
-        bootstrap_ep_vals[i] = (
-            np.mean(augmented_sample) - np.mean(reference_sample)
+        bootstrap_ep_vals[start:stop] = (
+            incremented_dps_vals[augmented_idx].mean(axis=1)
+            - base_dps_vals[reference_idx].mean(axis=1)
         )
 
     ep_error_bar = np.std(bootstrap_ep_vals)
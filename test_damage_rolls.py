@@ -0,0 +1,150 @@
+"""Consistency checks between the vectorized damage roll helpers and the
+scalar rolls used during a fight. Run with pytest."""
+
+import numpy as np
+import pytest
+import player as player_class
+import sim_utils
+
+
+def make_player():
+    """Build a representative raid buffed Player for damage roll checks.
+
+    Returns:
+        player (player.Player): Player with damage parameters calculated.
+    """
+    player = player_class.Player(
+        attack_power=10000, ap_mod=1.1*1.1, agility=1500, hit_chance=0.08,
+        spell_hit_chance=0.17, expertise_rating=100, crit_chance=0.55,
+        spell_crit_chance=0.2, armor_pen_rating=800,
+        swing_timer=sim_utils.calc_swing_timer(300, 1.2*1.03), mana=10000,
+        intellect=300, spirit=300, mp5=100, omen=False,
+    )
+    player.calc_damage_params(
+        gift_of_arthas=True, boss_armor=10643, sunder=True, faerie_fire=True,
+        blood_frenzy=True, curse_of_elements=True, shattering_throw=False
+    )
+    player.reset()
+    return player
+
+
+def check_white_outcomes(
+    damage_done, low, damage_range, miss_chance, crit_chance,
+    crit_multiplier, damage_multiplier
+):
+    """Check the roll table outcomes and damage support of a set of swings.
+
+    Arguments:
+        damage_done (np.ndarray): Damage done by each swing.
+        low (float): Low end base damage of the swing.
+        damage_range (float): Width of the base damage range.
+        miss_chance (float): Expected fraction of avoided swings.
+        crit_chance (float): Expected fraction of critical strikes.
+        crit_multiplier (float): Damage multiplier on crits.
+        damage_multiplier (float): Expected multiplier from Savage Roar or
+            King of the Jungle on top of the roll table.
+    """
+    low *= damage_multiplier
+    high = low + damage_range * damage_multiplier
+    tol = 1e-9 * high
+    miss = damage_done == 0.0
+    glance = (damage_done > 0.65 * low - tol) & (damage_done <= 0.85 * high)
+    hit = (damage_done >= low - tol) & (damage_done <= high + tol)
+    crit = (
+        (damage_done >= crit_multiplier * low - tol)
+        & (damage_done <= crit_multiplier * high + tol)
+    )
+
+    # Every swing must land in exactly one bucket of the roll table
+    outcomes = np.stack([miss, glance, hit, crit])
+    assert np.all(np.sum(outcomes, axis=0) == 1)
+    assert abs(np.mean(miss) - miss_chance) < 0.005
+    assert abs(np.mean(glance) - 0.24) < 0.01
+    assert abs(np.mean(crit) - crit_chance) < 0.01
+
+    # Regular hits must span the full base damage range
+    assert abs(np.min(damage_done[hit]) - low) < 0.01 * (high - low)
+    assert abs(np.max(damage_done[hit]) - high) < 0.01 * (high - low)
+
+    # Glancing blows must be reduced by 15% to 35%
+    assert np.max(damage_done[glance]) > 0.84 * low
+    assert np.min(damage_done[glance]) < 0.66 * high
+
+
+@pytest.mark.parametrize(
+    'cat_form, savage_roar, enrage, damage_multiplier',
+    [(True, False, False, 1.0), (True, True, False, 1.3),
+     (False, False, True, 1.15)]
+)
+def test_sample_swing_damage_matches_swing(
+    cat_form, savage_roar, enrage, damage_multiplier
+):
+    sim_utils.seed_rng(1)
+    player = make_player()
+    player.cat_form = cat_form
+    player.savage_roar = savage_roar
+    player.enrage = enrage
+
+    if cat_form:
+        low, damage_range = player.white_low, player.white_range
+        crit_chance = player.crit_chance
+    else:
+        low, damage_range = player.white_bear_low, player.white_bear_range
+        crit_chance = player.crit_chance - 0.04
+
+    num_swings = 50000
+    batch_damage = player.sample_swing_damage(num_swings)
+    scalar_damage = np.array([player.swing() for _ in range(num_swings)])
+
+    for damage_done in [batch_damage, scalar_damage]:
+        check_white_outcomes(
+            damage_done, low, damage_range, player.miss_chance, crit_chance,
+            player.calc_crit_multiplier(), damage_multiplier
+        )
+
+    assert abs(np.mean(batch_damage) / np.mean(scalar_damage) - 1) < 0.01
+
+
+def test_yellow_damage_batch_matches_scalar_rolls():
+    sim_utils.seed_rng(2)
+    low, high, miss_chance, crit_chance = 3000.0, 3500.0, 0.08, 0.45
+    crit_multiplier = 2.1
+    num_attacks = 20000
+    batch_rolls = sim_utils.calc_yellow_damage_batch(
+        num_attacks, low, high, miss_chance, crit_chance,
+        crit_multiplier=crit_multiplier
+    )
+    scalar_rolls = [np.array(outcome) for outcome in zip(*[
+        sim_utils.calc_yellow_damage(
+            low, high, miss_chance, crit_chance,
+            crit_multiplier=crit_multiplier
+        ) for _ in range(num_attacks)
+    ])]
+
+    for damage_done, miss, crit in [batch_rolls, scalar_rolls]:
+        miss = miss.astype(bool)
+        crit = crit.astype(bool)
+        hit = ~(miss | crit)
+        assert not np.any(miss & crit)
+        assert np.all(damage_done[miss] == 0.0)
+
+        # Hits and crits must each span exactly their damage range
+        tol = 0.01 * (high - low)
+        assert abs(np.min(damage_done[hit]) - low) < tol
+        assert abs(np.max(damage_done[hit]) - high) < tol
+        assert np.all((damage_done[hit] >= low) & (damage_done[hit] <= high))
+        crit_low = crit_multiplier * low
+        crit_high = crit_multiplier * high
+        assert abs(np.min(damage_done[crit]) - crit_low) < 2 * tol
+        assert abs(np.max(damage_done[crit]) - crit_high) < 2 * tol
+        assert np.all(
+            (damage_done[crit] >= crit_low) & (damage_done[crit] <= crit_high)
+        )
+
+        # Crits are rolled only for attacks that were not avoided
+        assert abs(np.mean(miss) - miss_chance) < 0.008
+        assert abs(np.mean(crit) - (1 - miss_chance) * crit_chance) < 0.015
+
+    batch_mean = np.mean(batch_rolls[0])
+    scalar_mean = np.mean(scalar_rolls[0])
+    assert abs(batch_mean / scalar_mean - 1) < 0.02
@@ -1,6 +1,7 @@
 """Code for modeling non-static trinkets in feral DPS simulation."""
 
 import numpy as np
+import heapq
 import wotlk_cat_sim as ccs
 import sim_utils
 
@@ -41,13 +42,30 @@ class Trinket():
         self.cooldown = cooldown
         self.reset()
 
+    @property
+    def uptime(self):
+        """Average fractional uptime of the proc up to the last update."""
+        if self.last_update <= 0:
+            return 0.0
+
+        return self.active_time / self.last_update
+
+    def set_ready_time(self):
+        """Store the absolute time at which the trinket comes off cooldown,
+        so that update() can compare against it directly. Must be called
+        whenever activation_time is set, which happens in activate() and at the
+        start of each fight in reset(). A change to the cooldown therefore
+        takes effect from the next activation or reset."""
+        self._ready_time = self.activation_time + self.cooldown - 1e-9
+
     def reset(self):
         """Set trinket to fresh inactive state with no cooldown remaining."""
         self.activation_time = -np.inf
+        self.set_ready_time()
         self.active = False
         self.can_proc = True
         self.num_procs = 0
-        self.uptime = 0.0
+        self.active_time = 0.0
         self.last_update = 0.0
 
     def modify_stat(self, time, player, sim, increment):
@@ -62,27 +80,60 @@ class Trinket():
             increment (float or np.ndarray): Quantity to add to the player's
                 existing stat value(s).
         """
-        # Convert stat name and stat increment to arrays if they are scalars
-        stat_names = np.atleast_1d(self.stat_name)
-        increments = np.atleast_1d(increment)
+        # A single stat name is given as a plain string, so wrap it for
+        # iteration. This is cheaper than normalizing with np.atleast_1d, and
+        # always reflects the current stat_name, which some subclasses change
+        # between activations.
+        stat_names = self.stat_name
+
+        if isinstance(stat_names, str):
+            stat_names = (stat_names,)
+
+        # Wrap scalar increments so that they can be paired with the stat
+        # names. Arrays are unpacked into native Python numbers, so that the
+        # modified Player stats don't get promoted to NumPy scalars, which are
+        # much slower in subsequent arithmetic.
+        if isinstance(increment, np.ndarray):
+            increments = increment.tolist() if increment.ndim else (
+                increment.item(),
+            )
+        else:
+            increments = (increment,)
+
+        stats_changed = False
+
+        for stat_name, stat_increment in zip(stat_names, increments):
+            stats_changed |= self._modify_stat(
+                time, player, sim, stat_name, stat_increment
+            )
 
-        for index, stat_name in enumerate(stat_names):
-            self._modify_stat(time, player, sim, stat_name, increments[index])
+        # Recalculate damage parameters once all player stats have changed,
+        # rather than once per modified stat.
+        if stats_changed:
+            player.calc_damage_params(**sim.params)
 
     @staticmethod
     def _modify_stat(time, player, sim, stat_name, increment):
         """Contains the actual stat modification functionality for a single
         stat. Called by the wrapper function, which handles potentially
-        iterating through multiple stats to be modified."""
+        iterating through multiple stats to be modified, and recalculates
+        the player's damage parameters afterwards if required.
+
+        Returns:
+            stats_changed (bool): Whether a raw player stat was changed, such
+                that damage parameters need to be recalculated.
+        """
         # Haste procs get handled separately from other raw stat buffs
         if stat_name == 'haste_rating':
             sim.apply_haste_buff(time, increment)
-        else:
-            old_value = getattr(player, stat_name)
-            setattr(player, stat_name, old_value + increment)
+            return False
 
-            # Recalculate damage parameters when player stats change
-            player.calc_damage_params(**sim.params)
+        if increment == 0:
+            return False
+
+        old_value = getattr(player, stat_name)
+        setattr(player, stat_name, old_value + increment)
+        return True
 
     def activate(self, time, player, sim):
         """Activate the trinket buff upon player usage or passive proc.
@@ -101,14 +152,15 @@ class Trinket():
                 be calculated in this method.
         """
         self.activation_time = time
+        self.set_ready_time()
         self.deactivation_time = time + self.proc_duration
+        self._deactivation_eps = self.deactivation_time - 1e-9
         self.modify_stat(time, player, sim, self.stat_increment)
-        sim.proc_end_times.append(self.deactivation_time)
 
         # In the case of a second trinket being used, the proc end time can
-        # sometimes be earlier than that of the first trinket, so the list of
-        # end times needs to be sorted.
-        sim.proc_end_times.sort()
+        # sometimes be earlier than that of the first trinket, so the end
+        # times are kept in a heap with the earliest one at the front.
+        heapq.heappush(sim.proc_end_times, self.deactivation_time)
 
         # Mark trinket as active
         self.active = True
@@ -165,25 +217,30 @@ class Trinket():
                 standard trinkets, but custom subclasses can implement fixed
                 damage procs that would be returned on each update.
         """
-        # Update average proc uptime value
-        if time > self.last_update:
-            dt = time - self.last_update
-            self.uptime = (
-                (self.uptime * self.last_update + dt * self.active) / time
-            )
+        # Accumulate the total time the proc has been active. This method
+        # runs for every trinket on every simulation event, so the average
+        # uptime is only calculated when requested, and attributes that are
+        # used more than once are read into locals.
+        last_update = self.last_update
+        active = self.active
+
+        if time > last_update:
+            if active:
+                self.active_time += time - last_update
+
             self.last_update = time
 
         # First check if an existing buff has fallen off
-        if self.active and (time > self.deactivation_time - 1e-9):
+        if active and (time > self._deactivation_eps):
             self.deactivate(player, sim)
 
         # Then check whether the trinket is off CD and can now proc
-        if (not self.can_proc
-                and (time - self.activation_time > self.cooldown - 1e-9)):
+        if (not self.can_proc) and (time > self._ready_time):
             self.can_proc = True
 
-        # Now decide whether a proc actually happens
-        if allow_activation and self.apply_proc():
+        # Now decide whether a proc actually happens. A trinket that is still
+        # on cooldown can never proc, so skip the check entirely in that case.
+        if allow_activation and self.can_proc and self.apply_proc():
             return self.activate(time, player, sim)
 
         # Return default damage dealt of 0
@@ -191,7 +248,8 @@ class Trinket():
 
     def apply_proc(self):
         """Determine whether or not the trinket is activated at the current
-        time. This method must be implemented by Trinket subclasses.
+        time. This method must be implemented by Trinket subclasses, and is
+        only consulted while the trinket is off cooldown (can_proc is True).
 
         Returns:
             proc_applied (bool): Whether or not the activation occurs.
@@ -247,10 +305,11 @@ class ActivatedTrinket(Trinket):
             # past so that the trinket is immediately ready for activation.
             self.activation_time = -np.inf
 
+        self.set_ready_time()
         self.active = False
         self.can_proc = not self.delay
         self.num_procs = 0
-        self.uptime = 0.0
+        self.active_time = 0.0
         self.last_update = 0.0
 
     def apply_proc(self):
@@ -262,9 +321,7 @@ class ActivatedTrinket(Trinket):
         """
         # Activated trinkets follow the simple logic of being used as soon as
         # they are available.
-        if self.can_proc:
-            return True
-        return False
+        return self.can_proc
 
 
 class HastePotion(ActivatedTrinket):
@@ -293,9 +350,7 @@ class HastePotion(ActivatedTrinket):
         """
         # Adjust standard ActivatedTrinket logic to prevent multiple Haste
         # Potion activations once combat has commenced.
-        if self.can_proc and (self.num_procs < self.max_procs):
-            return True
-        return False
+        return self.can_proc and (self.num_procs < self.max_procs)
 
 
 class Bloodlust(ActivatedTrinket):
@@ -325,17 +380,20 @@ class Bloodlust(ActivatedTrinket):
                 fight execution.
         """
         old_multi = sim.haste_multiplier
-        not_bear = not player.bear_form
-        haste_rating = sim_utils.calc_haste_rating(
-            sim.swing_timer, multiplier=old_multi, cat_form=not_bear
-        )
         multi_fac = 1./1.3 if self.active else 1.3
-        new_multi = old_multi * multi_fac
-        new_swing_timer = sim_utils.calc_swing_timer(
-            haste_rating, multiplier=new_multi, cat_form=not_bear
-        )
+
+        # The swing timer is inversely proportional to the haste multiplier,
+        # so it can be rescaled directly without a haste rating round trip.
+        new_swing_timer = sim.swing_timer / multi_fac
         sim.update_swing_times(time, new_swing_timer)
-        sim.haste_multiplier = new_multi
+        sim.haste_multiplier = old_multi * multi_fac
+
+        # The hasted GCD is capped at 1 second, so it still needs to be
+        # recalculated from the underlying haste rating.
+        haste_rating = sim_utils.calc_haste_rating(
+            new_swing_timer, multiplier=sim.haste_multiplier,
+            cat_form=not player.bear_form
+        )
         player.update_spell_gcd(
             haste_rating, multiplier=player.spell_haste_multiplier * multi_fac
         )
@@ -456,9 +514,9 @@ class ProcTrinket(Trinket):
         )
 
         if yellow_chance_on_hit is not None:
-            self.rates = {
-                'white': chance_on_hit, 'yellow': yellow_chance_on_hit
-            }
+            # Stored as a (white, yellow) pair so that check_for_proc() can
+            # index it directly with the yellow flag
+            self.rates = (chance_on_hit, yellow_chance_on_hit)
             self.separate_yellow_procs = True
         else:
             self.chance_on_hit = chance_on_hit
@@ -486,10 +544,10 @@ class ProcTrinket(Trinket):
         if not self.can_proc:
             return
 
-        proc_roll = np.random.rand()
+        proc_roll = sim_utils.rand()
 
         if self.separate_yellow_procs:
-            rate = self.rates['yellow'] if yellow else self.rates['white']
+            rate = self.rates[yellow]
         else:
             rate = self.chance_on_crit if crit else self.chance_on_hit
 
@@ -504,16 +562,18 @@ class ProcTrinket(Trinket):
         Returns:
             proc_applied (bool): Whether or not the activation occurs.
         """
-        if self.can_proc and self.proc_happened:
-            self.proc_happened = False
-            return True
-        return False
+        # The pending proc is consumed either way, since proc_happened can
+        # only be set while the trinket is off cooldown.
+        proc_applied = self.can_proc and self.proc_happened
+        self.proc_happened = False
+        return proc_applied
 
     def reset(self):
         """Set trinket to fresh inactive state with no cooldown remaining."""
         Trinket.reset(self)
         self.can_proc = self.icd_precombat > self.cooldown - 1e-9 if self.icd_precombat else True
         self.activation_time = -self.icd_precombat if self.icd_precombat else -np.inf
+        self.set_ready_time()
         self.proc_happened = False
 
     def activate(self, time, player, sim):
@@ -607,7 +667,7 @@ class DeathbringersWill(ProcTrinket):
     def activate(self, time, player, sim):
         """Roll for which transformation will be applied, then call normal
         trinket activation loop."""
-        roll = np.random.rand()
+        roll = sim_utils.rand()
 
         if roll < 1.0/3.0:
             self.proc_name = 'Strength of the Vrykul'
@@ -680,25 +740,30 @@ class StackingProcTrinket(ProcTrinket):
         self.max_stacks = max_stacks
         self.aura_name = aura_name
         self.stack_name = stack_name
-        self.stack_proc_rates = {
-            'white': chance_on_hit, 'yellow': yellow_chance_on_hit
-        }
+        self.stack_proc_rates = (chance_on_hit, yellow_chance_on_hit)
         self.activated_aura = (aura_type == 'activated')
+
+        if aura_proc_rates is not None:
+            aura_proc_rates = (
+                aura_proc_rates['white'], aura_proc_rates['yellow']
+            )
+
         self.aura_proc_rates = aura_proc_rates
         ProcTrinket.__init__(
             self, stat_name=stat_name, stat_increment=self.default_increment,
             proc_name=aura_name, proc_duration=aura_duration,
-            cooldown=cooldown, chance_on_hit=self.stack_proc_rates['white'],
-            yellow_chance_on_hit=self.stack_proc_rates['yellow']
+            cooldown=cooldown, chance_on_hit=chance_on_hit,
+            yellow_chance_on_hit=yellow_chance_on_hit
         )
 
     def reset(self):
         """Full reset of the trinket at the start of a fight."""
         self.activation_time = -np.inf
+        self.set_ready_time()
         self._reset()
         self.stat_increment = self.default_increment
         self.num_procs = 0
-        self.uptime = 0.0
+        self.active_time = 0.0
         self.last_update = 0.0
 
     def _reset(self):
@@ -834,7 +899,7 @@ class InstantDamageProc(ProcTrinket):
             (8. - (player.miss_chance - player.dodge_chance) * 100)
             * 32.79 / 26.23 / 100
         )
-        miss_roll = np.random.rand()
+        miss_roll = sim_utils.rand()
 
         if miss_roll < miss_chance:
             if sim.log:
@@ -845,7 +910,7 @@ class InstantDamageProc(ProcTrinket):
             return 0.0
 
         # Now roll the base damage done by the proc
-        base_damage = self.min_damage + np.random.rand() * self.damage_range
+        base_damage = self.min_damage + sim_utils.rand() * self.damage_range
         base_damage *= 1.03 * 1.13 # assume Santified Retribution / CoE
 
         # Now roll for partial resists. Assume that the boss has no nature
@@ -853,7 +918,7 @@ class InstantDamageProc(ProcTrinket):
         # resistance of 24 for a boss mob. The partial resist table for this
         # condition was taken from this calculator:
         # https://royalgiraffe.github.io/legacy-sim/#/resistances
-        resist_roll = np.random.rand()
+        resist_roll = sim_utils.rand()
 
         if resist_roll < 0.84:
             dmg_done = base_damage
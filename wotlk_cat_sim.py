@@ -3,6 +3,7 @@
 import numpy as np
 import copy
 import collections
+import heapq
 import urllib
 import multiprocessing
 import psutil
@@ -1763,13 +1764,14 @@ class Simulation():
             haste_rating_delta (int): Amount by which the player Haste Rating
                 changes.
         """
+        cat_form = not self.player.bear_form
         new_haste_rating = haste_rating_delta + sim_utils.calc_haste_rating(
             self.swing_timer, multiplier=self.haste_multiplier,
-            cat_form=not self.player.bear_form
+            cat_form=cat_form
         )
         new_swing_timer = sim_utils.calc_swing_timer(
             new_haste_rating, multiplier=self.haste_multiplier,
-            cat_form=not self.player.bear_form
+            cat_form=cat_form
         )
         self.update_swing_times(time, new_swing_timer)
         self.player.update_spell_gcd(new_haste_rating)
@@ -1787,8 +1789,7 @@ class Simulation():
         self.tf_end = time + 6.
         self.player.tf_cd = 30.
         self.next_action = time + self.latency
-        self.proc_end_times.append(time + 30.)
-        self.proc_end_times.sort()
+        heapq.heappush(self.proc_end_times, time + 30.)
 
         if self.log:
             self.combat_log.append(
@@ -1891,10 +1892,9 @@ class Simulation():
 
         # Since a handful of proc effects trigger only on periodic damage, we
         # separately check for those procs here.
-        for trinket in self.player.proc_trinkets:
-            if trinket.periodic_only:
-                trinket.check_for_proc(False, True)
-                tick_damage += trinket.update(time, self.player, self)
+        for trinket in self.player.periodic_proc_trinkets:
+            trinket.check_for_proc(False, True)
+            tick_damage += trinket.update(time, self.player, self)
 
         
         if self.player.t8_2p_bonus and time - 15 >= self.t8_2p_icd:
@@ -1953,7 +1953,8 @@ class Simulation():
             swing_timer_start, self.player.swing_timer, first_swing=True
         )
 
-        # Reset all trinkets to fresh state
+        # Reset all trinkets to fresh state, and clear the min-heap of
+        # upcoming aura expiration times
         self.proc_end_times = []
 
         for trinket in self.trinkets:
@@ -2264,7 +2265,7 @@ class Simulation():
 
             # If a proc ended at this timestep, remove it from the list
             if self.proc_end_times and (time == self.proc_end_times[0]):
-                self.proc_end_times.pop(0)
+                heapq.heappop(self.proc_end_times)
 
             # If our Energy just dropped low enough, then cast Tiger's Fury
             #tf_energy_thresh = 30
@@ -2379,10 +2380,15 @@ class Simulation():
 
         return output
 
-    def iterate(self, *args):
+    def iterate(self, seed=None):
         """Perform one iteration of a multi-replicate calculation with a
         randomized fight length.
 
+        Arguments:
+            seed (np.random.SeedSequence): Optional seed for this iteration's
+                random number streams. Defaults to None, which draws fresh
+                entropy from the operating system.
+
         Returns:
             avg_dps (float): Average DPS on this iteration.
             dmg_breakdown (dict): Breakdown of cast count and damage done by
@@ -2395,8 +2401,14 @@ class Simulation():
         """
         # Since we're getting the same snapshot of the Simulation object
         # when multiple iterations are run in parallel, we need to generate a
-        # new random seed.
-        np.random.seed()
+        # new random seed. The legacy global generator used outside of the
+        # damage rolls only accepts a 32-bit integer seed.
+        if seed is None:
+            np.random.seed()
+        else:
+            np.random.seed(seed.generate_state(1)[0])
+
+        sim_utils.seed_rng(seed)
 
         # Randomize fight length to avoid haste clipping effects. We will
         # use a normal distribution centered around the target length, with
@@ -2417,7 +2429,20 @@ class Simulation():
 
         return avg_dps, dmg_breakdown, aura_stats, oom_time
 
-    def run_replicates(self, num_replicates, detailed_output=False):
+    @staticmethod
+    def create_pool():
+        """Spawn a pool of worker processes for running replicates in
+        parallel, with one worker per physical CPU core.
+
+        Returns:
+            pool (multiprocessing.Pool): Worker pool. The caller is
+                responsible for closing the pool once finished.
+        """
+        return multiprocessing.Pool(processes=psutil.cpu_count(logical=False))
+
+    def run_replicates(
+        self, num_replicates, detailed_output=False, pool=None, seed=None
+    ):
         """Perform several runs of the simulation in order to collect
         statistics on performance.
 
@@ -2425,6 +2450,16 @@ class Simulation():
             num_replicates (int): Number of replicates to run.
             detailed_output (bool): Whether to consolidate details about cast
                 and mana statistics in addition to DPS values. Defaults False.
+            pool (multiprocessing.Pool): Optional pre-spawned worker pool to
+                run the replicates on. Supplying a pool allows repeated calls
+                (such as the stat weight calculation) to skip the worker
+                startup cost. If omitted, a fresh pool is created and closed
+                for this call only.
+            seed (int): Optional root seed from which an independent random
+                stream is spawned for each replicate, making the results
+                reproducible regardless of how replicates are distributed
+                across workers. Defaults to None, which draws fresh entropy
+                from the operating system.
 
         Returns:
             dps_vals (np.ndarray): Array containing average DPS of each run.
@@ -2450,48 +2485,66 @@ class Simulation():
         if detailed_output:
             oom_times = np.zeros(num_replicates)
 
-        # Create pool of workers to run replicates in parallel
-        pool = multiprocessing.Pool(processes=psutil.cpu_count(logical=False))
-        i = 0
-
-        for output in pool.imap(self.iterate, range(num_replicates)):
-            avg_dps, dmg_breakdown, aura_stats, time_to_oom = output
-            dps_vals[i] = avg_dps
+        # Create pool of workers to run replicates in parallel, unless the
+        # caller has already provided one.
+        owns_pool = pool is None
 
-            if not detailed_output:
-                i += 1
-                continue
-
-            # Consolidate damage breakdown for the fight
-            if i == 0:
-                cast_sum = copy.deepcopy(dmg_breakdown)
-                aura_sum = copy.deepcopy(aura_stats)
-            else:
-                for ability in cast_sum:
-                    for key in cast_sum[ability]:
-                        val = dmg_breakdown[ability][key]
-                        cast_sum[ability][key] = (
-                            (cast_sum[ability][key] * i + val) / (i + 1)
-                        )
-                for row in range(len(aura_sum)):
-                    for col in [1, 2]:
-                        val = aura_stats[row][col]
-                        aura_sum[row][col] = (
-                            (aura_sum[row][col] * i + val) / (i + 1)
-                        )
+        if owns_pool:
+            pool = self.create_pool()
 
-            # Consolidate oom time
-            oom_times[i] = time_to_oom
-            i += 1
+        # Give each replicate its own child seed so that no two workers
+        # share a random number stream.
+        seeds = np.random.SeedSequence(seed).spawn(num_replicates)
+        i = 0
 
-        pool.close()
+        # Replicates are deliberately dispatched one at a time. Each task
+        # unpickles its own copy of the Simulation, which guarantees that
+        # every fight starts from the same Player and trinket state even
+        # though run() does not undo buffs that are still active when a fight
+        # ends.
+        try:
+            for output in pool.imap(self.iterate, seeds):
+                avg_dps, dmg_breakdown, aura_stats, time_to_oom = output
+                dps_vals[i] = avg_dps
+
+                if not detailed_output:
+                    i += 1
+                    continue
+
+                # Consolidate damage breakdown for the fight
+                if i == 0:
+                    cast_sum = copy.deepcopy(dmg_breakdown)
+                    aura_sum = copy.deepcopy(aura_stats)
+                else:
+                    for ability in cast_sum:
+                        for key in cast_sum[ability]:
+                            val = dmg_breakdown[ability][key]
+                            cast_sum[ability][key] = (
+                                (cast_sum[ability][key] * i + val) / (i + 1)
+                            )
+                    for row in range(len(aura_sum)):
+                        for col in [1, 2]:
+                            val = aura_stats[row][col]
+                            aura_sum[row][col] = (
+                                (aura_sum[row][col] * i + val) / (i + 1)
+                            )
+
+                # Consolidate oom time
+                oom_times[i] = time_to_oom
+                i += 1
+        finally:
+            if owns_pool:
+                pool.close()
+                pool.join()
 
         if not detailed_output:
             return dps_vals
 
         return dps_vals, cast_sum, aura_sum, oom_times
 
-    def calc_deriv(self, num_replicates, param, increment, base_dps_sample):
+    def calc_deriv(
+        self, num_replicates, param, increment, base_dps_sample, pool=None
+    ):
         """Calculate DPS increase after incrementing a player stat.
 
         Arguments:
@@ -2500,6 +2553,8 @@ class Simulation():
             increment (float): Magnitude of stat increment.
             base_dps_sample (np.ndarray): Pre-calculated statistical sample of
                 base DPS before stat increments.
+            pool (multiprocessing.Pool): Optional worker pool to reuse for the
+                replicate runs. Defaults to spawning a new pool.
 
         Returns:
             dps_delta (float): Average DPS increase after the stat increment.
@@ -2531,7 +2586,7 @@ class Simulation():
             self.player.spell_crit_chance += increment
 
         # Calculate DPS
-        dps_vals = self.run_replicates(num_replicates)
+        dps_vals = self.run_replicates(num_replicates, pool=pool)
         avg_dps = np.mean(dps_vals)
 
         # Reset the stat to original value
@@ -2584,77 +2639,98 @@ class Simulation():
         print('\n')
         dps_deltas = {}
 
-        if base_dps_sample is None:
-            base_dps_sample = self.run_replicates(num_replicates)
+        # Share a single worker pool across all of the derivative runs below
+        # so that worker startup is paid only once per stat weight calculation.
+        pool = self.create_pool()
+        try:
+            if base_dps_sample is None:
+                base_dps_sample = self.run_replicates(
+                    num_replicates, pool=pool
+                )
 
-        base_dps = np.mean(base_dps_sample)
+            base_dps = np.mean(base_dps_sample)
 
-        # For all stats, we will use a much larger increment than +1 in order
-        # to see sufficient DPS increases above the simulation noise. We will
-        # then linearize the increase down to a +1 increment for weight
-        # calculation. This approximation is accurate as long as DPS is linear
-        # in each stat up to the larger increment that was used.
+            # For all stats, we will use a much larger increment than +1 in
+            # order to see sufficient DPS increases above the simulation noise.
+            # We will then linearize the increase down to a +1 increment for
+            # weight calculation. This approximation is accurate as long as
+            # DPS is linear in each stat up to the larger increment that was
+            # used.
 
-        # For AP, we will use an increment of +80 AP. We also scale the
-        # increase by a factor of 1.1 to account for HotW
-        dps_deltas['Attack Power'] = 1.0/80.0 * self.calc_deriv(
-            num_replicates, 'attack_power', 80 * self.player.ap_mod,
-            base_dps_sample
-        )
+            # For AP, we will use an increment of +80 AP. We also scale the
+            # increase by a factor of 1.1 to account for HotW
+            dps_deltas['Attack Power'] = 1.0/80.0 * self.calc_deriv(
+                num_replicates, 'attack_power', 80 * self.player.ap_mod,
+                base_dps_sample, pool=pool
+            )
 
-        # For hit and crit, we will use an increment of 2%.
+            # For hit and crit, we will use an increment of 2%.
 
-        # For hit, we reduce miss chance by 2% if well below hit cap, and
-        # increase miss chance by 2% when already capped or close.
-        # Assumption made here is that the player should only be concerned
-        # with the melee hit
-        sign = 1 - 2 * int(
-            self.player.miss_chance - self.player.dodge_chance > 0.02
-        )
-        dps_deltas['Hit Rating'] = -0.5 / 32.79 * sign * self.calc_deriv(
-            num_replicates, 'miss_chance', sign * 0.02, base_dps_sample
-        )
+            # For hit, we reduce miss chance by 2% if well below hit cap, and
+            # increase miss chance by 2% when already capped or close.
+            # Assumption made here is that the player should only be concerned
+            # with the melee hit
+            sign = 1 - 2 * int(
+                self.player.miss_chance - self.player.dodge_chance > 0.02
+            )
+            dps_deltas['Hit Rating'] = -0.5 / 32.79 * sign * self.calc_deriv(
+                num_replicates, 'miss_chance', sign * 0.02, base_dps_sample,
+                pool=pool
+            )
 
-        # For expertise, we mimic hit, except with dodge.
-        sign = 1 - 2 * int(self.player.dodge_chance > 0.02)
-        dps_deltas['Expertise Rating'] = -0.5 / 32.79 * sign * self.calc_deriv(
-            num_replicates, 'dodge_chance', sign * 0.02, base_dps_sample
-        )
+            # For expertise, we mimic hit, except with dodge.
+            sign = 1 - 2 * int(self.player.dodge_chance > 0.02)
+            dps_deltas['Expertise Rating'] = (
+                -0.5 / 32.79 * sign * self.calc_deriv(
+                    num_replicates, 'dodge_chance', sign * 0.02,
+                    base_dps_sample, pool=pool
+                )
+            )
 
-        # Crit is a simple increment
-        dps_deltas['Critical Strike Rating'] = 0.5 / 45.91 * self.calc_deriv(
-            num_replicates, 'crit_chance', 0.02, base_dps_sample
-        )
+            # Crit is a simple increment
+            dps_deltas['Critical Strike Rating'] = (
+                0.5 / 45.91 * self.calc_deriv(
+                    num_replicates, 'crit_chance', 0.02, base_dps_sample,
+                    pool=pool
+                )
+            )
 
-        # For haste we will use an increment of 4%. (Note that this is 4% in
-        # one slot and not four individual 1% buffs.) We implement the
-        # increment by reducing the player swing timer.
-        base_haste_rating = sim_utils.calc_haste_rating(
-            self.player.swing_timer, multiplier=self.haste_multiplier
-        )
-        swing_delta = self.player.swing_timer - sim_utils.calc_swing_timer(
-            base_haste_rating + 100.84, multiplier=self.haste_multiplier
-        )
-        dps_deltas['Haste Rating'] = 0.25 / 25.21 * self.calc_deriv(
-            num_replicates, 'swing_timer', -swing_delta, base_dps_sample
-        )
+            # For haste we will use an increment of 4%. (Note that this is 4%
+            # in one slot and not four individual 1% buffs.) We implement the
+            # increment by reducing the player swing timer.
+            base_haste_rating = sim_utils.calc_haste_rating(
+                self.player.swing_timer, multiplier=self.haste_multiplier
+            )
+            swing_delta = self.player.swing_timer - sim_utils.calc_swing_timer(
+                base_haste_rating + 100.84, multiplier=self.haste_multiplier
+            )
+            dps_deltas['Haste Rating'] = 0.25 / 25.21 * self.calc_deriv(
+                num_replicates, 'swing_timer', -swing_delta, base_dps_sample,
+                pool=pool
+            )
 
-        # Due to bearweaving, separate Agility weight calculation is needed
-        dps_deltas['Agility'] = 1.0/65.0 * self.calc_deriv(
-            num_replicates, 'agility', 65 * agi_mod, base_dps_sample
-        )
+            # Due to bearweaving, separate Agility weight calculation is needed
+            dps_deltas['Agility'] = 1.0/65.0 * self.calc_deriv(
+                num_replicates, 'agility', 65 * agi_mod, base_dps_sample,
+                pool=pool
+            )
 
-        # For armor pen, we use an increment of 65 Rating. Similar to hit,
-        # the sign of the delta depends on if we're near the 1399 cap.
-        sign = 1 - 2 * int(self.player.armor_pen_rating > 1334)
-        dps_deltas['Armor Pen Rating'] = 1./65. * sign * self.calc_deriv(
-            num_replicates, 'armor_pen_rating', sign * 65, base_dps_sample
-        )
+            # For armor pen, we use an increment of 65 Rating. Similar to hit,
+            # the sign of the delta depends on if we're near the 1399 cap.
+            sign = 1 - 2 * int(self.player.armor_pen_rating > 1334)
+            dps_deltas['Armor Pen Rating'] = 1./65. * sign * self.calc_deriv(
+                num_replicates, 'armor_pen_rating', sign * 65, base_dps_sample,
+                pool=pool
+            )
 
-        # For weapon damage, we use an increment of 65
-        dps_deltas['Weapon Damage'] = 1./65. * self.calc_deriv(
-            num_replicates, 'bonus_damage', 65, base_dps_sample
-        )
+            # For weapon damage, we use an increment of 65
+            dps_deltas['Weapon Damage'] = 1./65. * self.calc_deriv(
+                num_replicates, 'bonus_damage', 65, base_dps_sample,
+                pool=pool
+            )
+        finally:
+            pool.close()
+            pool.join()
 
         # Calculate normalized stat weights
         stat_weights = {}